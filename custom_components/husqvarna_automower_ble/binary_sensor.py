@@ -14,7 +14,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from . import HusqvarnaConfigEntry
-from .entity import HusqvarnaAutomowerBleDescriptorEntity
+from .entity import MISSING, HusqvarnaAutomowerBleDescriptorEntity
 
 LOGGER = logging.getLogger(__name__)
 
@@ -35,10 +35,13 @@ async def async_setup_entry(
 ) -> None:
     """Set up Husqvarna Automower Ble binary sensor based on a config entry."""
     coordinator = entry.runtime_data
+    data = coordinator.data
     async_add_entities(
-        HusqvarnaAutomowerBleBinarySensor(coordinator, description)
-        for description in DESCRIPTIONS
-        if description.key in coordinator.data
+        [
+            HusqvarnaAutomowerBleBinarySensor(coordinator, description)
+            for description in DESCRIPTIONS
+            if description.key in data
+        ]
     )
 
 
@@ -52,34 +55,24 @@ class HusqvarnaAutomowerBleBinarySensor(
     @property
     def is_on(self) -> bool | None:
         """Return the state of the binary sensor."""
-        try:
-            key = self.entity_description.key
-            # Check if key exists in coordinator data
-            if key not in self.coordinator.data:
-                LOGGER.debug("Key '%s' not found in coordinator data", key)
-                return None
-
-            value = self.coordinator.data[key]
-
-            # Convert to boolean if not already
-            if isinstance(value, bool):
-                return value
-            elif isinstance(value, (int, str)):
-                return bool(value)
-            else:
-                LOGGER.warning(
-                    "Unexpected value type for binary sensor %s: %s (%s)",
-                    key,
-                    value,
-                    type(value),
-                )
-                return None
+        key = self.entity_description.key
+        value = self.coordinator.data.get(key, MISSING)
+        if value is MISSING:
+            LOGGER.debug("Key '%s' not found in coordinator data", key)
+            return None
 
-        except Exception as e:
-            LOGGER.error(
-                "Error processing state for binary sensor %s: %s",
-                self.entity_description.key,
-                e,
-                exc_info=True,
-            )
+        if value is None:
+            # Not read from the mower yet
             return None
+        # Convert to boolean if not already
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, (int, str)):
+            return bool(value)
+        LOGGER.warning(
+            "Unexpected value type for binary sensor %s: %s (%s)",
+            key,
+            value,
+            type(value),
+        )
+        return None
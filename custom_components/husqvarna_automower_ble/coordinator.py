@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
 import logging
 from typing import Any
@@ -14,8 +15,9 @@ from bleak import BleakError
 from bleak_retry_connector import close_stale_connections_by_address
 
 from homeassistant.components import bluetooth
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
 
@@ -25,6 +27,62 @@ if TYPE_CHECKING:
     from . import HusqvarnaConfigEntry
 
 SCAN_INTERVAL = timedelta(seconds=600)
+# Statistics are monotonic totals, no need to read them on every poll
+STATISTICS_INTERVAL = timedelta(hours=1)
+
+
+async def _async_read_is_charging(mower: Mower) -> bool | None:
+    """Return whether the mower is charging, or None if it did not answer."""
+    # Mower.is_charging() turns a timed out response into False
+    response = await mower.command("IsCharging")
+    return None if response is None else bool(response)
+
+
+# Coordinator data key and the Mower read for it on every poll. The reads
+# return None when the mower does not answer in time.
+POLL_GETTERS: dict[str, Callable[[Mower], Awaitable[Any]]] = {
+    "battery_level": Mower.battery_level,
+    "is_charging": _async_read_is_charging,
+    "mode": Mower.mower_mode,
+    "state": Mower.mower_state,
+    "activity": Mower.mower_activity,
+    "error": Mower.mower_error,
+    "next_start_time": Mower.mower_next_start_time,
+}
+
+# Coordinator data keys filled from mower_statistics()
+STATISTICS_KEYS = (
+    "total_running_time",
+    "total_cutting_time",
+    "total_charging_time",
+    "total_searching_time",
+    "number_of_collisions",
+    "number_of_charging_cycles",
+)
+
+# Seconds to let the mower act on a command before reading back its state
+COMMAND_SETTLE_DELAY = 1
+
+# Failed polls in a row before the connection is dropped and re-established
+MAX_CONSECUTIVE_FAILURES = 3
+
+# Connect attempts on reconnect, with an exponential backoff in seconds
+CONNECT_ATTEMPTS = 2
+CONNECT_BACKOFF = 0.5
+
+
+def _normalize_next_start_time(value: Any) -> datetime | None:
+    """Return the next start time as an aware datetime for the sensor."""
+    if value is None:
+        return None
+    # Ensure value is a datetime object for TIMESTAMP device class
+    if not isinstance(value, datetime):
+        LOGGER.warning("Expected datetime for next_start_time, got %s", type(value))
+        return None
+    if not value.tzinfo:
+        # Naive datetime - convert to Home Assistant timezone
+        return dt_util.as_local(value)
+    return value
 
 
 class HusqvarnaCoordinator(DataUpdateCoordinator[dict[str, str | int]]):
@@ -46,12 +104,19 @@ class HusqvarnaCoordinator(DataUpdateCoordinator[dict[str, str | int]]):
             config_entry=config_entry,
             name=DOMAIN,
             update_interval=SCAN_INTERVAL,
+            # Only notify the entities when a poll returns different data
+            always_update=False,
         )
         self.address = address
         self.channel_id = channel_id
         self.model = model
         self.mower = mower
         self._last_successful_update: datetime | None = None
+        self._stats_interval = STATISTICS_INTERVAL
+        self._last_stats: datetime | None = None
+        self._consecutive_failures = 0
+        # Bumped by every command, lets a poll spot commands run between reads
+        self._command_generation = 0
         self._connection_lock = asyncio.Lock()
 
     async def async_shutdown(self) -> None:
@@ -60,53 +125,148 @@ class HusqvarnaCoordinator(DataUpdateCoordinator[dict[str, str | int]]):
         await super().async_shutdown()
         # Acquire the lock to ensure no operations are in progress during shutdown
         async with self._connection_lock:
-            if self.mower.is_connected():
-                try:
-                    await self.mower.disconnect()
-                    LOGGER.debug("Disconnected mower during shutdown")
-                except Exception as ex:
-                    LOGGER.warning("Error disconnecting during shutdown: %s", ex)
+            await self._async_disconnect()
+
+    async def _async_disconnect(self) -> None:
+        """Disconnect the mower, if it is still connected."""
+        # is_connected() only checks the client, but disconnect() fails on
+        # a client whose backend is already torn down
+        if not self.mower.is_connected():
+            return
+        try:
+            await self.mower.disconnect()
+            LOGGER.debug("Disconnected mower")
+        except Exception as ex:
+            LOGGER.warning("Error disconnecting: %s", ex)
+
+    async def _async_poll_failed(
+        self, message: str, err: Exception
+    ) -> dict[str, str | int]:
+        """Handle a failed poll.
+
+        The last known data is returned until MAX_CONSECUTIVE_FAILURES polls
+        in a row have failed. The update then fails and the connection is
+        dropped, so the next poll starts from a fresh connection.
+        """
+        self._consecutive_failures += 1
+        if (
+            self.data is not None
+            and self._consecutive_failures < MAX_CONSECUTIVE_FAILURES
+        ):
+            LOGGER.debug(
+                "%s, keeping last known data (%s/%s failed polls)",
+                message,
+                self._consecutive_failures,
+                MAX_CONSECUTIVE_FAILURES,
+            )
+            return self.data
+
+        LOGGER.debug(
+            "%s consecutive failed polls, forcing a reconnect",
+            self._consecutive_failures,
+        )
+        async with self._connection_lock:
+            await self._async_disconnect()
+        self.async_update_listeners()
+        raise UpdateFailed(message) from err
+
+    @callback
+    def _async_mower_answered(self) -> None:
+        """Clear the failed poll count after the mower answered again."""
+        recovered = self._consecutive_failures >= MAX_CONSECUTIVE_FAILURES
+        self._consecutive_failures = 0
+        if recovered:
+            # Entity availability follows the failure count, which the
+            # coordinator's change detection does not see
+            self.async_update_listeners()
 
     async def _async_find_device(self):
         LOGGER.debug("Trying to reconnect")
-        await close_stale_connections_by_address(self.address)
 
-        device = bluetooth.async_ble_device_from_address(
-            self.hass, self.address, connectable=True
-        )
+        # Mower.connect already retries the BLE connection through
+        # bleak-retry-connector, this only covers a failed handshake.
+        for attempt in range(CONNECT_ATTEMPTS):
+            # A failed attempt can leave a client connected after pairing
+            await close_stale_connections_by_address(self.address)
+            device = bluetooth.async_ble_device_from_address(
+                self.hass, self.address, connectable=True
+            )
 
-        try:
-            if await self.mower.connect(device) is not ResponseResult.OK:
-                raise UpdateFailed("Failed to connect")
-        except (TimeoutError, BleakError) as err:
-            raise UpdateFailed("Failed to connect") from err
+            try:
+                result = await self.mower.connect(device)
+            except (TimeoutError, BleakError) as err:
+                if attempt == CONNECT_ATTEMPTS - 1:
+                    raise UpdateFailed("Failed to connect") from err
+                reason = str(err)
+            else:
+                if result is ResponseResult.OK:
+                    return
+                # UNKNOWN_ERROR is what a timed out handshake returns
+                if (
+                    result is not ResponseResult.UNKNOWN_ERROR
+                    or attempt == CONNECT_ATTEMPTS - 1
+                ):
+                    raise UpdateFailed(f"Failed to connect, mower returned {result}")
+                reason = str(result)
+
+            delay = CONNECT_BACKOFF * 2**attempt
+            LOGGER.debug(
+                "Connect attempt %s failed, retrying in %ss: %s",
+                attempt + 1,
+                delay,
+                reason,
+            )
+            await asyncio.sleep(delay)
 
     async def _async_update_data(self) -> dict[str, str | int]:
         """Poll the device."""
         LOGGER.debug("Polling device")
 
+        # Start from the previous values so the totals survive polls that
+        # skip the statistics read
         data: dict[str, str | int] = {}
+        data.update(self.data or {})
+        generation = self._command_generation
 
-        async with self._connection_lock:
-            try:
+        try:
+            async with self._connection_lock:
                 if not self.mower.is_connected():
                     await self._async_find_device()
-            except BleakError as err:
-                self.async_update_listeners()
-                raise UpdateFailed("Failed to connect") from err
+        except (BleakError, UpdateFailed) as err:
+            return await self._async_poll_failed("Failed to connect", err)
 
-            try:
-                data["battery_level"] = await self.mower.battery_level()
-                data["is_charging"] = await self.mower.is_charging()
-                data["mode"] = await self.mower.mower_mode()
-                data["state"] = await self.mower.mower_state()
-                data["activity"] = await self.mower.mower_activity()
-                data["error"] = await self.mower.mower_error()
-                data["next_start_time"] = await self.mower.mower_next_start_time()
+        # The lock is taken per read rather than for the whole poll. It wakes
+        # waiters in order, so a command issued mid-poll only waits for the
+        # read in flight instead of the rest of the poll. read_at holds the
+        # command generation each key was read at, see the merge below.
+        read_at: dict[str, int] = {}
+        try:
+            # The mower answers one request at a time over a single
+            # characteristic, so the reads are issued in turn. A failed
+            # read keeps the previous value for that key, or None when there
+            # is none yet, so every key is present from the first refresh.
+            failed = 0
+            for key in POLL_GETTERS:
+                async with self._connection_lock:
+                    if await self._async_safe_read(data, key):
+                        read_at[key] = self._command_generation
+                    else:
+                        failed += 1
+                        data.setdefault(key, None)
+
+            if failed == len(POLL_GETTERS):
+                # Nothing could be read, the connection is most likely gone
+                raise BleakError("No response from device")
 
+            now = dt_util.utcnow()
+            if (
+                self._last_stats is None
+                or now - self._last_stats > self._stats_interval
+            ):
                 # Fetch mower statistics with error handling
                 try:
-                    stats = await self.mower.mower_statistics()
+                    async with self._connection_lock:
+                        stats = await self.mower.mower_statistics()
                     if stats is not None:
                         data["total_running_time"] = stats["totalRunningTime"]
                         data["total_cutting_time"] = stats["totalCuttingTime"]
@@ -116,29 +276,87 @@ class HusqvarnaCoordinator(DataUpdateCoordinator[dict[str, str | int]]):
                         data["number_of_charging_cycles"] = stats[
                             "numberOfChargingCycles"
                         ]
+                        self._last_stats = now
                 except Exception as ex:
                     LOGGER.warning("Failed to fetch mower statistics: %s", ex)
-                    # Continue without statistics data
+                    # Continue with the previous statistics data
 
-                self._last_successful_update = datetime.now()
+            self._last_successful_update = now
+            self._async_mower_answered()
 
-            except BleakError as err:
-                LOGGER.error("Error getting data from device")
-                self.async_update_listeners()
-                raise UpdateFailed("Error getting data from device") from err
-            except Exception as ex:
-                LOGGER.exception("Unexpected error while fetching data: %s", ex)
-                self.async_update_listeners()
-                raise UpdateFailed("Unexpected error fetching data") from ex
-            finally:
-                # Ensure the mower is disconnected after polling
-                if self.mower.is_connected():
-                    await self.mower.disconnect()
+        except BleakError as err:
+            LOGGER.error("Error getting data from device")
+            return await self._async_poll_failed("Error getting data from device", err)
+        except Exception as ex:
+            LOGGER.exception("Unexpected error while fetching data: %s", ex)
+            return await self._async_poll_failed("Unexpected error fetching data", ex)
+
+        if self._command_generation != generation:
+            # A command ran mid-poll and pushed fresher data, keep that and
+            # only apply the keys read after the last command
+            LOGGER.debug("Command executed during poll, merging newer reads")
+            newer = {
+                key: data[key]
+                for key, read_generation in read_at.items()
+                if read_generation == self._command_generation
+            }
+            # Commands do not change the statistics totals
+            newer.update({key: data[key] for key in STATISTICS_KEYS if key in data})
+            data = {**(self.data or {}), **newer}
 
         return data
 
-    async def async_execute_command(self, command_func, *args, **kwargs) -> Any:
-        """Execute a command on the mower with connection locking."""
+    @callback
+    def async_set_updated_data(self, data: dict[str, str | int]) -> None:
+        """Push new data, notifying the entities only if a value changed."""
+        if data == self.data:
+            # Leave the scheduled poll as is, nothing needs to be written
+            LOGGER.debug("Pushed data unchanged, not notifying listeners")
+            return
+        super().async_set_updated_data(data)
+
+    async def _async_safe_read(self, data: dict[str, Any], key: str) -> bool:
+        """Read a poll key into data, returning whether the mower answered.
+
+        A read returning None, as on a timed out response, counts as a failed
+        read. On failure data keeps whatever value it
+        already had for the key.
+        """
+        try:
+            value = await POLL_GETTERS[key](self.mower)
+        except BleakError as err:
+            LOGGER.debug("Failed to read %s: %s", key, err)
+            return False
+        if key == "next_start_time":
+            # None also means no start is scheduled, so it is stored, but it
+            # does not show the mower answered
+            data[key] = _normalize_next_start_time(value)
+            return value is not None
+        if value is None:
+            LOGGER.debug("No response reading %s", key)
+            return False
+        data[key] = value
+        return True
+
+    async def _async_read_keys(self, keys: tuple[str, ...]) -> dict[str, Any]:
+        """Read the given poll keys, skipping any that fail."""
+        data: dict[str, Any] = {}
+        for key in keys:
+            await self._async_safe_read(data, key)
+        return data
+
+    async def async_execute_command(
+        self,
+        command_func,
+        *args,
+        affected_keys: tuple[str, ...] = (),
+        **kwargs,
+    ) -> Any:
+        """Execute a command on the mower with connection locking.
+
+        The poll keys in affected_keys are read back after the command and
+        pushed to the entities, instead of refreshing all the data.
+        """
         LOGGER.debug("Executing command: %s", command_func.__name__)
 
         async with self._connection_lock:
@@ -148,9 +366,9 @@ class HusqvarnaCoordinator(DataUpdateCoordinator[dict[str, str | int]]):
 
                 # Execute the command
                 result = await command_func(*args, **kwargs)
+                self._command_generation += 1
 
                 LOGGER.debug("Command %s executed successfully", command_func.__name__)
-                return result
 
             except BleakError as ex:
                 LOGGER.error(
@@ -164,3 +382,15 @@ class HusqvarnaCoordinator(DataUpdateCoordinator[dict[str, str | int]]):
                     ex,
                 )
                 raise
+
+        if affected_keys:
+            # Poll reads may run while the mower settles, they are discarded
+            # by the generation bump that comes with the read-back below
+            await asyncio.sleep(COMMAND_SETTLE_DELAY)
+            async with self._connection_lock:
+                if new_data := await self._async_read_keys(affected_keys):
+                    self._command_generation += 1
+                    self.async_set_updated_data({**(self.data or {}), **new_data})
+                    self._async_mower_answered()
+
+        return result
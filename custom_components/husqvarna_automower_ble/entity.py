@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-
 from homeassistant.helpers.device_registry import (
     CONNECTION_BLUETOOTH,
     DeviceInfo,
@@ -13,7 +11,10 @@ from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, MANUFACTURER
-from .coordinator import HusqvarnaCoordinator
+from .coordinator import MAX_CONSECUTIVE_FAILURES, HusqvarnaCoordinator
+
+# Marks a key that is missing from the coordinator data
+MISSING = object()
 
 
 class HusqvarnaAutomowerBleEntity(CoordinatorEntity[HusqvarnaCoordinator]):
@@ -36,11 +37,11 @@ class HusqvarnaAutomowerBleEntity(CoordinatorEntity[HusqvarnaCoordinator]):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
+        # The coordinator keeps the last known data through a few failed
+        # polls, the entities stay available until it gives up
         if self.coordinator._last_successful_update is None:
             return False
-        return datetime.now() - self.coordinator._last_successful_update < timedelta(
-            minutes=12
-        )
+        return self.coordinator._consecutive_failures < MAX_CONSECUTIVE_FAILURES
 
 
 class HusqvarnaAutomowerBleDescriptorEntity(HusqvarnaAutomowerBleEntity):
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 
 from husqvarna_automower_ble.protocol import MowerActivity, MowerState
@@ -22,6 +21,10 @@ from .entity import HusqvarnaAutomowerBleEntity
 
 LOGGER = logging.getLogger(__name__)
 
+# Coordinator keys read back after a command, instead of a full refresh
+ACTIVITY_KEYS = ("state", "activity")
+SCHEDULE_KEYS = ("mode", "state", "activity", "next_start_time")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -132,19 +135,19 @@ class AutomowerLawnMower(HusqvarnaAutomowerBleEntity, LawnMowerEntity):
         LOGGER.debug("Starting mower")
 
         try:
-            await self.coordinator.async_execute_command(
-                self.coordinator.mower.mower_resume
-            )
             if self._attr_activity == LawnMowerActivity.DOCKED:
                 await self.coordinator.async_execute_command(
-                    self.coordinator.mower.mower_override
+                    self.coordinator.mower.mower_resume
+                )
+                await self.coordinator.async_execute_command(
+                    self.coordinator.mower.mower_override,
+                    affected_keys=ACTIVITY_KEYS,
+                )
+            else:
+                await self.coordinator.async_execute_command(
+                    self.coordinator.mower.mower_resume,
+                    affected_keys=ACTIVITY_KEYS,
                 )
-
-            await asyncio.sleep(1)
-            await self.coordinator.async_request_refresh()
-
-            self._attr_activity = self._get_activity()
-            self.async_write_ha_state()
         except Exception as ex:
             LOGGER.error("Failed to start mowing: %s", ex)
 
@@ -154,14 +157,9 @@ class AutomowerLawnMower(HusqvarnaAutomowerBleEntity, LawnMowerEntity):
 
         try:
             await self.coordinator.async_execute_command(
-                self.coordinator.mower.mower_park
+                self.coordinator.mower.mower_park,
+                affected_keys=ACTIVITY_KEYS,
             )
-
-            await asyncio.sleep(1)
-            await self.coordinator.async_request_refresh()
-
-            self._attr_activity = self._get_activity()
-            self.async_write_ha_state()
         except Exception as ex:
             LOGGER.error("Failed to dock mower: %s", ex)
 
@@ -171,14 +169,9 @@ class AutomowerLawnMower(HusqvarnaAutomowerBleEntity, LawnMowerEntity):
 
         try:
             await self.coordinator.async_execute_command(
-                self.coordinator.mower.mower_pause
+                self.coordinator.mower.mower_pause,
+                affected_keys=ACTIVITY_KEYS,
             )
-
-            await asyncio.sleep(1)
-            await self.coordinator.async_request_refresh()
-
-            self._attr_activity = self._get_activity()
-            self.async_write_ha_state()
         except Exception as ex:
             LOGGER.error("Failed to pause mower: %s", ex)
 
@@ -188,14 +181,9 @@ class AutomowerLawnMower(HusqvarnaAutomowerBleEntity, LawnMowerEntity):
 
         try:
             await self.coordinator.async_execute_command(
-                self.coordinator.mower.mower_park_indefinitely
+                self.coordinator.mower.mower_park_indefinitely,
+                affected_keys=SCHEDULE_KEYS,
             )
-
-            await asyncio.sleep(1)
-            await self.coordinator.async_request_refresh()
-
-            self._attr_activity = self._get_activity()
-            self.async_write_ha_state()
         except Exception as ex:
             LOGGER.error("Failed to park mower indefinitely: %s", ex)
 
@@ -205,13 +193,8 @@ class AutomowerLawnMower(HusqvarnaAutomowerBleEntity, LawnMowerEntity):
 
         try:
             await self.coordinator.async_execute_command(
-                self.coordinator.mower.mower_auto
+                self.coordinator.mower.mower_auto,
+                affected_keys=SCHEDULE_KEYS,
             )
-
-            await asyncio.sleep(1)
-            await self.coordinator.async_request_refresh()
-
-            self._attr_activity = self._get_activity()
-            self.async_write_ha_state()
         except Exception as ex:
             LOGGER.error("Failed to resume mower schedule: %s", ex)
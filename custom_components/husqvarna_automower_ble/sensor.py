@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 import logging
-from datetime import datetime
+from typing import Any
 
 from husqvarna_automower_ble.protocol import ModeOfOperation, MowerState, MowerActivity
 from husqvarna_automower_ble.error_codes import ErrorCodes
@@ -17,13 +18,34 @@ from homeassistant.components.sensor import (
 from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-from homeassistant.util import dt as dt_util
 
 from . import HusqvarnaConfigEntry
-from .entity import HusqvarnaAutomowerBleDescriptorEntity
+from .entity import MISSING, HusqvarnaAutomowerBleDescriptorEntity
 
 LOGGER = logging.getLogger(__name__)
 
+# Enum value to name lookups, built once instead of per state read
+_MODE_NAMES = {mode.value: mode.name for mode in ModeOfOperation}
+_STATE_NAMES = {state.value: state.name for state in MowerState}
+_ACTIVITY_NAMES = {activity.value: activity.name for activity in MowerActivity}
+_ERROR_NAMES = {error.value: error.name for error in ErrorCodes}
+
+# ENUM sensor options, shared with the lookups above
+_MODE_OPTIONS = list(_MODE_NAMES.values())
+_STATE_OPTIONS = list(_STATE_NAMES.values())
+_ACTIVITY_OPTIONS = list(_ACTIVITY_NAMES.values())
+_ERROR_OPTIONS = list(_ERROR_NAMES.values())
+
+# Per key conversion of the coordinator value, keys without a handler are
+# returned as is. Unknown enum values map to None, they are not valid options.
+# The next start time is already normalized by the coordinator.
+_HANDLERS: dict[str, Callable[[Any], Any]] = {
+    "mode": _MODE_NAMES.get,
+    "state": _STATE_NAMES.get,
+    "activity": _ACTIVITY_NAMES.get,
+    "error": _ERROR_NAMES.get,
+}
+
 DESCRIPTIONS = (
     SensorEntityDescription(
         key="battery_level",
@@ -37,21 +59,21 @@ DESCRIPTIONS = (
         key="mode",
         device_class=SensorDeviceClass.ENUM,
         icon="mdi:robot",
-        options=[mode.name for mode in ModeOfOperation],
+        options=_MODE_OPTIONS,
     ),
     SensorEntityDescription(
         name="State",
         key="state",
         device_class=SensorDeviceClass.ENUM,
         icon="mdi:state-machine",
-        options=[state.name for state in MowerState],
+        options=_STATE_OPTIONS,
     ),
     SensorEntityDescription(
         name="Activity",
         key="activity",
         device_class=SensorDeviceClass.ENUM,
         icon="mdi:run",
-        options=[activity.name for activity in MowerActivity],
+        options=_ACTIVITY_OPTIONS,
     ),
     SensorEntityDescription(
         name="Error",
@@ -59,7 +81,7 @@ DESCRIPTIONS = (
         device_class=SensorDeviceClass.ENUM,
         entity_category=EntityCategory.DIAGNOSTIC,
         icon="mdi:alert-circle",
-        options=[error.name for error in ErrorCodes],
+        options=_ERROR_OPTIONS,
     ),
     SensorEntityDescription(
         name="Next Start Time",
@@ -131,10 +153,13 @@ async def async_setup_entry(
 ) -> None:
     """Set up Husqvarna Automower Ble sensor based on a config entry."""
     coordinator = entry.runtime_data
+    data = coordinator.data
     async_add_entities(
-        HusqvarnaAutomowerBleSensor(coordinator, description)
-        for description in DESCRIPTIONS
-        if description.key in coordinator.data
+        [
+            HusqvarnaAutomowerBleSensor(coordinator, description)
+            for description in DESCRIPTIONS
+            if description.key in data
+        ]
     )
 
 
@@ -146,40 +171,17 @@ class HusqvarnaAutomowerBleSensor(HusqvarnaAutomowerBleDescriptorEntity, SensorE
     @property
     def native_value(self) -> str | None:
         """Return the state of the sensor."""
-        try:
-            key = self.entity_description.key
-            # Check if key exists in coordinator data
-            if key not in self.coordinator.data:
-                LOGGER.debug("Key '%s' not found in coordinator data", key)
-                return None
-            value = self.coordinator.data[key]
-
-            if key == "mode":
-                value = ModeOfOperation(value).name
-            elif key == "state":
-                value = MowerState(value).name
-            elif key == "activity":
-                value = MowerActivity(value).name
-            elif key == "error":
-                value = ErrorCodes(value).name
-            elif key == "next_start_time" and value is not None:
-                # Ensure value is a datetime object for TIMESTAMP device class
-                if isinstance(value, datetime):
-                    if not value.tzinfo:
-                        # Naive datetime - convert to Home Assistant timezone
-                        value = dt_util.as_local(value)
-                else:
-                    LOGGER.warning(
-                        "Expected datetime for next_start_time, got %s", type(value)
-                    )
-                    value = None
+        key = self.entity_description.key
+        value = self.coordinator.data.get(key, MISSING)
+        if value is MISSING:
+            LOGGER.debug("Key '%s' not found in coordinator data", key)
+            return None
 
+        handler = _HANDLERS.get(key)
+        if handler is None:
             return value
-        except Exception as e:
-            LOGGER.error(
-                "Error processing state for sensor %s: %s",
-                self.entity_description.key,
-                e,
-                exc_info=True,
-            )
+        try:
+            return handler(value)
+        except (TypeError, ValueError) as e:
+            LOGGER.error("Error processing state for sensor %s: %s", key, e)
             return None